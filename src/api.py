@@ -1,23 +1,36 @@
 import asyncio
+import json
 import os
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 
+import anyio
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
 from hatchet_sdk import Context, Hatchet
 from loguru import logger
 from pydantic import BaseModel, HttpUrl
 
+from src.info_cache import InfoCache
 from src.social_video_downloader import SocialVideoDownloader
+from src.task_store import TaskStore
 
 load_dotenv()
 
-logger.add("api.log", rotation="10 MB", retention="7 days", level="INFO")
+# enqueue=True hands file writes to a background thread
+logger.add("api.log", rotation="10 MB", retention="7 days", level="INFO", enqueue=True)
 
-hatchet = Hatchet(debug=True)
+hatchet = Hatchet(debug=os.getenv("HATCHET_DEBUG") == "1")
 
 app = FastAPI(
     title="Social Video Downloader API with Hatchet",
@@ -27,7 +40,126 @@ app = FastAPI(
 
 downloader = SocialVideoDownloader(download_dir="./download")
 
-task_results: Dict[str, Dict[str, Any]] = {}
+# Resolved once so /files only resolves the requested path
+DOWNLOAD_ROOT = Path("./download").resolve()
+
+task_store = TaskStore(
+    redis_url=os.getenv("REDIS_URL"),
+    max_entries=int(os.getenv("TASK_STORE_MAX_ENTRIES", 10000)),
+    ttl=int(os.getenv("TASK_TTL", 86400)),
+)
+
+# Shares the task store's Redis connection pool, if it has one
+info_cache = InfoCache(
+    redis=task_store.redis,
+    ttl=int(os.getenv("VIDEO_INFO_CACHE_TTL", 3600)),
+)
+
+# Requests waiting for a task to finish: task_id -> (request loop, event)
+task_waiters: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+VIDEO_INFO_TIMEOUT = float(os.getenv("VIDEO_INFO_TIMEOUT", 30))
+
+# Seconds between task store checks while waiting on a task run by another
+# worker process, which cannot set this process's waiter event
+TASK_POLL_INTERVAL = float(os.getenv("TASK_POLL_INTERVAL", 0.5))
+
+# URLs of one batch workflow run downloaded at the same time
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 8))
+
+# Single downloads are grouped into BatchVideoDownload runs of up to
+# DOWNLOAD_CLUSTER_SIZE URLs, flushed DOWNLOAD_CLUSTER_TIMEOUT_MS after the
+# first one is queued. The default size of 1 dispatches each download directly.
+DOWNLOAD_CLUSTER_SIZE = int(os.getenv("DOWNLOAD_CLUSTER_SIZE", 1))
+DOWNLOAD_CLUSTER_TIMEOUT_MS = int(os.getenv("DOWNLOAD_CLUSTER_TIMEOUT_MS", 3000))
+
+# (task_id, url, (video, audio, subtitles)) waiting to be clustered, or None
+# to flush the queue and stop on shutdown
+download_queue: "asyncio.Queue[Optional[Tuple[str, str, Tuple[bool, bool, bool]]]]" = (
+    asyncio.Queue()
+)
+
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Local time in ISO format, like datetime.now().isoformat()
+
+    The date and time part only changes once a second, so it is cached and
+    just the microseconds are formatted on each call.
+    """
+    global _now_iso_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _now_iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _now_iso_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+def notify_task_done(task_id: str):
+    """Wake up the request waiting on a task, if any
+
+    Workflow steps run on the Hatchet worker's event loop, so the event is
+    set on the loop of the request that is waiting for it.
+    """
+    waiter = task_waiters.get(task_id)
+    if waiter:
+        loop, event = waiter
+        loop.call_soon_threadsafe(event.set)
+
+
+async def wait_for_task(
+    task_id: str, done: asyncio.Event, timeout: float
+) -> Optional[Dict]:
+    """Wait up to timeout seconds for a task to complete or fail
+
+    The event wakes the request as soon as the step finishes in this process.
+    The step may also run in another worker process, so the task store is
+    checked every TASK_POLL_INTERVAL seconds as well.
+
+    Returns:
+        The last task record seen, or None if it was never written
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while True:
+        task = await task_store.get(task_id)
+        if task and task.get("status") in ("completed", "failed"):
+            return task
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return task
+
+        try:
+            await asyncio.wait_for(
+                done.wait(), timeout=min(TASK_POLL_INTERVAL, remaining)
+            )
+        except asyncio.TimeoutError:
+            pass
+
+
+def child_task_result(url_result: Dict) -> Dict:
+    """Task fields for a single download that ran as part of a cluster"""
+    if "success" in url_result:
+        success = url_result["success"]
+    else:
+        # Playlist or channel
+        success = url_result.get("failed_downloads", 1) == 0
+    success = success and not url_result.get("error")
+
+    child = {
+        "status": "completed" if success else "failed",
+        "result": url_result,
+        "completed_at": _now_iso(),
+    }
+    if not success:
+        child["error"] = url_result.get("error")
+    return child
 
 
 class SingleDownloadInput(BaseModel):
@@ -62,40 +194,46 @@ class SingleVideoDownloadWorkflow:
     """Workflow for downloading a single video"""
 
     @hatchet.step(name="download_video")
-    def download_video(self, context: Context) -> dict:
+    async def download_video(self, context: Context) -> dict:
         input_data = context.workflow_input()
         task_id = input_data["task_id"]
 
-        # Update task status
-        task_results[task_id] = {
-            "status": "processing",
-            "started_at": datetime.now().isoformat(),
-            "url": input_data["url"],
-        }
+        # Update task status, keeping created_at from the API
+        await task_store.update(
+            task_id,
+            {
+                "status": "processing",
+                "started_at": _now_iso(),
+                "url": input_data["url"],
+            },
+        )
 
         logger.info(f"Processing download task {task_id} for URL: {input_data['url']}")
 
         try:
-            # Perform the download
-            result = downloader.download_single_video(
+            # Perform the download off the event loop
+            result = await asyncio.to_thread(
+                downloader.download_single_video,
                 url=input_data["url"],
                 video=input_data["video"],
                 audio=input_data["audio"],
                 subtitles=input_data["subtitles"],
             )
 
-            # Update task results
-            task_results[task_id]["status"] = (
-                "completed" if result["success"] else "failed"
-            )
-            task_results[task_id]["result"] = result
-            task_results[task_id]["completed_at"] = datetime.now().isoformat()
+            # Update task results in one write
+            payload = {
+                "status": "completed" if result["success"] else "failed",
+                "result": result,
+                "completed_at": _now_iso(),
+            }
 
             if result["success"]:
                 logger.success(f"Download task {task_id} completed successfully")
             else:
                 logger.error(f"Download task {task_id} failed: {result.get('error')}")
-                task_results[task_id]["error"] = result.get("error")
+                payload["error"] = result.get("error")
+
+            await task_store.update(task_id, payload)
 
             return {
                 "task_id": task_id,
@@ -106,9 +244,10 @@ class SingleVideoDownloadWorkflow:
 
         except Exception as e:
             logger.error(f"Error processing download task {task_id}: {str(e)}")
-            task_results[task_id]["status"] = "failed"
-            task_results[task_id]["error"] = str(e)
-            task_results[task_id]["completed_at"] = datetime.now().isoformat()
+            await task_store.update(
+                task_id,
+                {"status": "failed", "error": str(e), "completed_at": _now_iso()},
+            )
 
             return {"task_id": task_id, "success": False, "error": str(e)}
 
@@ -118,36 +257,63 @@ class BatchVideoDownloadWorkflow:
     """Workflow for downloading multiple videos"""
 
     @hatchet.step(name="download_batch")
-    def download_batch(self, context: Context) -> dict:
+    async def download_batch(self, context: Context) -> dict:
         input_data = context.workflow_input()
         task_id = input_data["task_id"]
 
-        # Update task status
-        task_results[task_id] = {
-            "status": "processing",
-            "started_at": datetime.now().isoformat(),
-            "urls": input_data["urls"],
-        }
+        # Update task status, keeping created_at from the API
+        started_at = _now_iso()
+        await task_store.update(
+            task_id,
+            {
+                "status": "processing",
+                "started_at": started_at,
+                "urls": input_data["urls"],
+            },
+        )
+
+        # Single-download tasks grouped into this batch, one per URL
+        child_task_ids = input_data.get("child_task_ids") or []
+        for child_id in child_task_ids:
+            await task_store.update(
+                child_id, {"status": "processing", "started_at": started_at}
+            )
+
+        # Each child is finalized as soon as its URL finishes, from the
+        # download thread, instead of waiting for the whole cluster
+        loop = asyncio.get_running_loop()
+        finished_children = set()
+
+        def finish_child(i: int, url_result: Dict):
+            asyncio.run_coroutine_threadsafe(
+                task_store.update(child_task_ids[i], child_task_result(url_result)),
+                loop,
+            ).result()
+            finished_children.add(i)
 
         logger.info(
             f"Processing batch download task {task_id} for {len(input_data['urls'])} URLs"
         )
 
         try:
-            # Perform the batch download
-            result = downloader.download_from_urls(
+            # Perform the batch download off the event loop, several URLs at once
+            result = await asyncio.to_thread(
+                downloader.download_from_urls,
                 urls=input_data["urls"],
                 download_options={
                     "video": input_data["video"],
                     "audio": input_data["audio"],
                     "subtitles": input_data["subtitles"],
                 },
+                max_workers=BATCH_CONCURRENCY,
+                on_result=finish_child if child_task_ids else None,
             )
 
-            # Update task results
-            task_results[task_id]["status"] = "completed"
-            task_results[task_id]["result"] = result
-            task_results[task_id]["completed_at"] = datetime.now().isoformat()
+            # Update task results in one write
+            await task_store.update(
+                task_id,
+                {"status": "completed", "result": result, "completed_at": _now_iso()},
+            )
 
             logger.success(
                 f"Batch download task {task_id} completed: "
@@ -164,9 +330,12 @@ class BatchVideoDownloadWorkflow:
 
         except Exception as e:
             logger.error(f"Error processing batch download task {task_id}: {str(e)}")
-            task_results[task_id]["status"] = "failed"
-            task_results[task_id]["error"] = str(e)
-            task_results[task_id]["completed_at"] = datetime.now().isoformat()
+            payload = {"status": "failed", "error": str(e), "completed_at": _now_iso()}
+            await task_store.update(task_id, payload)
+
+            for i, child_id in enumerate(child_task_ids):
+                if i not in finished_children:
+                    await task_store.update(child_id, payload)
 
             return {"task_id": task_id, "success": False, "error": str(e)}
 
@@ -176,7 +345,7 @@ class VideoInfoExtractionWorkflow:
     """Workflow for extracting video information"""
 
     @hatchet.step(name="extract_info")
-    def extract_info(self, context: Context) -> dict:
+    async def extract_info(self, context: Context) -> dict:
         input_data = context.workflow_input()
         task_id = input_data["task_id"]
 
@@ -184,22 +353,29 @@ class VideoInfoExtractionWorkflow:
 
         try:
             # Extract video info
-            info = downloader.get_video_info(input_data["url"])
+            info = await asyncio.to_thread(downloader.get_video_info, input_data["url"])
 
             if info:
-                task_results[task_id] = {
-                    "status": "completed",
-                    "info": info,
-                    "completed_at": datetime.now().isoformat(),
-                }
+                await info_cache.set(input_data["url"], info)
+                await task_store.set(
+                    task_id,
+                    {
+                        "status": "completed",
+                        "info": info,
+                        "completed_at": _now_iso(),
+                    },
+                )
 
                 return {"task_id": task_id, "success": True, "info": info}
             else:
-                task_results[task_id] = {
-                    "status": "failed",
-                    "error": "Could not extract video information",
-                    "completed_at": datetime.now().isoformat(),
-                }
+                await task_store.set(
+                    task_id,
+                    {
+                        "status": "failed",
+                        "error": "Could not extract video information",
+                        "completed_at": _now_iso(),
+                    },
+                )
 
                 return {
                     "task_id": task_id,
@@ -209,14 +385,20 @@ class VideoInfoExtractionWorkflow:
 
         except Exception as e:
             logger.error(f"Error extracting video info: {str(e)}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e),
-                "completed_at": datetime.now().isoformat(),
-            }
+            await task_store.set(
+                task_id,
+                {
+                    "status": "failed",
+                    "error": str(e),
+                    "completed_at": _now_iso(),
+                },
+            )
 
             return {"task_id": task_id, "success": False, "error": str(e)}
 
+        finally:
+            notify_task_done(task_id)
+
 
 class SingleDownloadRequest(BaseModel):
     """Request model for single video download"""
@@ -268,10 +450,114 @@ class TaskResponse(BaseModel):
     hatchet_run_id: Optional[str] = None
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with API information"""
-    return {
+async def spawn_download_cluster(
+    options: Tuple[bool, bool, bool], tasks: List[Tuple[str, str]]
+):
+    """Spawn one BatchVideoDownload run for a cluster of single downloads"""
+    video, audio, subtitles = options
+    cluster_task_id = uuid.uuid4().hex
+    child_task_ids = [task_id for task_id, _ in tasks]
+
+    try:
+        spawned = await hatchet.client.admin.aio_run_workflow(
+            "BatchVideoDownload",
+            {
+                "urls": [url for _, url in tasks],
+                "video": video,
+                "audio": audio,
+                "subtitles": subtitles,
+                "task_id": cluster_task_id,
+                "child_task_ids": child_task_ids,
+            },
+        )
+
+        logger.info(
+            f"Spawned cluster {cluster_task_id} for {len(tasks)} downloads, "
+            f"run_id: {spawned.workflow_run_id}"
+        )
+        fields = {
+            "cluster_task_id": cluster_task_id,
+            "hatchet_run_id": spawned.workflow_run_id,
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to spawn download cluster: {str(e)}")
+        fields = {"status": "failed", "error": str(e)}
+
+    for task_id in child_task_ids:
+        await task_store.update(task_id, fields)
+
+
+async def cluster_downloads():
+    """Group queued single downloads into batch workflow runs"""
+    loop = asyncio.get_running_loop()
+    stopping = False
+
+    while not stopping:
+        item = await download_queue.get()
+        if item is None:
+            break
+        cluster = [item]
+        deadline = loop.time() + DOWNLOAD_CLUSTER_TIMEOUT_MS / 1000
+
+        while len(cluster) < DOWNLOAD_CLUSTER_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(download_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                # Shutting down: dispatch what was collected, then stop
+                stopping = True
+                break
+            cluster.append(item)
+
+        # A batch run shares one set of download options
+        groups: Dict[Tuple[bool, bool, bool], List[Tuple[str, str]]] = {}
+        for task_id, url, options in cluster:
+            groups.setdefault(options, []).append((task_id, url))
+
+        for options, tasks in groups.items():
+            try:
+                await spawn_download_cluster(options, tasks)
+            except Exception as e:
+                logger.error(f"Failed to dispatch download cluster: {str(e)}")
+
+
+@app.on_event("startup")
+async def start_download_clustering():
+    """Start the background task that dispatches clustered downloads"""
+    if DOWNLOAD_CLUSTER_SIZE > 1:
+        app.state.cluster_task = asyncio.create_task(cluster_downloads())
+
+
+@app.on_event("shutdown")
+async def stop_download_clustering():
+    """Dispatch the downloads still queued for clustering before exiting"""
+    cluster_task = getattr(app.state, "cluster_task", None)
+    if cluster_task is None:
+        return
+
+    await download_queue.put(None)
+    await cluster_task
+
+    # Anything queued after the flush can no longer be dispatched
+    payload = {
+        "status": "failed",
+        "error": "API shut down before the download was dispatched",
+        "completed_at": _now_iso(),
+    }
+    while not download_queue.empty():
+        item = download_queue.get_nowait()
+        if item is not None:
+            await task_store.update(item[0], payload)
+
+
+# The API information never changes, so it is serialized once
+ROOT_RESPONSE_BODY = json.dumps(
+    {
         "name": "Social Video Downloader API with Hatchet",
         "version": "2.0.0",
         "endpoints": {
@@ -286,17 +572,28 @@ async def root():
         },
         "powered_by": "Hatchet Distributed Task Queue",
     }
+).encode()
+
+
+@app.get("/")
+async def root():
+    """Root endpoint with API information"""
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "download_dir": downloader.download_dir,
-        "hatchet": "connected",
-    }
+    # Plain str values, so skip FastAPI's jsonable_encoder pass
+    return JSONResponse(
+        {
+            "status": "healthy",
+            "timestamp": _now_iso(),
+            "download_dir": downloader.download_dir,
+            "hatchet": "connected",
+            "task_store": task_store.backend,
+        }
+    )
 
 
 @app.post("/download", response_model=TaskResponse)
@@ -309,21 +606,37 @@ async def download_single(request: SingleDownloadRequest):
     - **audio**: Download audio file (default: true)
     - **subtitles**: Download subtitles (default: true)
     """
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
+    url = request.url.unicode_string()
 
     # Initialize task status
-    task_results[task_id] = {
+    task = {
         "status": "pending",
-        "url": str(request.url),
-        "created_at": datetime.now().isoformat(),
+        "url": url,
+        "created_at": _now_iso(),
     }
+    await task_store.set(task_id, task)
+
+    if DOWNLOAD_CLUSTER_SIZE > 1:
+        await download_queue.put(
+            (
+                task_id,
+                url,
+                (request.video, request.audio, request.subtitles),
+            )
+        )
+        return TaskResponse(
+            task_id=task_id,
+            status="pending",
+            message=f"Download task queued for {url}",
+        )
 
     try:
         # Spawn the workflow
-        spawned = hatchet.client.admin.run_workflow(
+        spawned = await hatchet.client.admin.aio_run_workflow(
             "SingleVideoDownload",
             {
-                "url": str(request.url),
+                "url": url,
                 "video": request.video,
                 "audio": request.audio,
                 "subtitles": request.subtitles,
@@ -338,14 +651,13 @@ async def download_single(request: SingleDownloadRequest):
         return TaskResponse(
             task_id=task_id,
             status="pending",
-            message=f"Download task created for {request.url}",
+            message=f"Download task created for {url}",
             hatchet_run_id=spawned.workflow_run_id,
         )
 
     except Exception as e:
         logger.error(f"Failed to spawn workflow: {str(e)}")
-        task_results[task_id]["status"] = "failed"
-        task_results[task_id]["error"] = str(e)
+        await task_store.update(task_id, {"status": "failed", "error": str(e)})
         raise HTTPException(status_code=500, detail=f"Failed to create task: {str(e)}")
 
 
@@ -359,21 +671,23 @@ async def download_batch(request: BatchDownloadRequest):
     - **audio**: Download audio files (default: true)
     - **subtitles**: Download subtitles (default: true)
     """
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
+    urls = [url.unicode_string() for url in request.urls]
 
     # Initialize task status
-    task_results[task_id] = {
+    task = {
         "status": "pending",
-        "urls": [str(url) for url in request.urls],
-        "created_at": datetime.now().isoformat(),
+        "urls": urls,
+        "created_at": _now_iso(),
     }
+    await task_store.set(task_id, task)
 
     try:
         # Spawn the workflow
-        spawned = hatchet.client.admin.run_workflow(
+        spawned = await hatchet.client.admin.aio_run_workflow(
             "BatchVideoDownload",
             {
-                "urls": [str(url) for url in request.urls],
+                "urls": urls,
                 "video": request.video,
                 "audio": request.audio,
                 "subtitles": request.subtitles,
@@ -388,14 +702,13 @@ async def download_batch(request: BatchDownloadRequest):
         return TaskResponse(
             task_id=task_id,
             status="pending",
-            message=f"Batch download task created for {len(request.urls)} URLs",
+            message=f"Batch download task created for {len(urls)} URLs",
             hatchet_run_id=spawned.workflow_run_id,
         )
 
     except Exception as e:
         logger.error(f"Failed to spawn batch workflow: {str(e)}")
-        task_results[task_id]["status"] = "failed"
-        task_results[task_id]["error"] = str(e)
+        await task_store.update(task_id, {"status": "failed", "error": str(e)})
         raise HTTPException(
             status_code=500, detail=f"Failed to create batch task: {str(e)}"
         )
@@ -408,44 +721,50 @@ async def get_task_status(task_id: str):
 
     - **task_id**: The task ID returned from download endpoints
     """
-    if task_id not in task_results:
+    body = await task_store.get_json(task_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return task_results[task_id]
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/video-info")
 async def get_video_info(
     url: HttpUrl = Query(..., description="Video URL to get information from"),
+    no_cache: bool = Query(False, description="Extract again even if cached"),
 ):
     """
     Get video information without downloading
 
     - **url**: Video URL to analyze
+    - **no_cache**: Skip recently extracted info for the same URL
     """
-    task_id = str(uuid.uuid4())
+    url_str = url.unicode_string()
+    if not no_cache:
+        info = await info_cache.get(url_str)
+        if info is not None:
+            return {"success": True, "info": info, "task_id": None, "cached": True}
+
+    task_id = uuid.uuid4().hex
+    done = asyncio.Event()
+    task_waiters[task_id] = (asyncio.get_running_loop(), done)
 
     try:
         # Spawn the workflow
-        spawned = hatchet.client.admin.run_workflow(
-            "VideoInfoExtraction", {"url": str(url), "task_id": task_id}
+        spawned = await hatchet.client.admin.aio_run_workflow(
+            "VideoInfoExtraction", {"url": url_str, "task_id": task_id}
         )
 
         logger.info(
             f"Spawned video info workflow for task {task_id}, run_id: {spawned.workflow_run_id}"
         )
 
-        # Wait a bit for quick responses
-        await asyncio.sleep(2)
-
-        # Check if completed
-        if (
-            task_id in task_results
-            and task_results[task_id].get("status") == "completed"
-        ):
+        # Wait for the workflow to report back, up to VIDEO_INFO_TIMEOUT
+        task = await wait_for_task(task_id, done, VIDEO_INFO_TIMEOUT)
+        if task and task.get("status") == "completed":
             return {
                 "success": True,
-                "info": task_results[task_id].get("info"),
+                "info": task.get("info"),
                 "task_id": task_id,
             }
         else:
@@ -462,45 +781,171 @@ async def get_video_info(
             status_code=500, detail=f"Failed to get video info: {str(e)}"
         )
 
+    finally:
+        task_waiters.pop(task_id, None)
+
+
+FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def parse_byte_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single "bytes=start-end" Range header into inclusive offsets
+
+    Returns None for headers that should be ignored (other units, multiple
+    ranges, malformed values) so the full file is served instead. Ranges that
+    cannot be satisfied start at or past file_size.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_str, _, end_str = spec.strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(end_str)
+            if suffix < 0:
+                return None
+            if suffix == 0:
+                # The last 0 bytes cannot be satisfied
+                return file_size, file_size - 1
+            start = max(file_size - suffix, 0)
+            end = file_size - 1
+    except ValueError:
+        return None
+
+    if start > end and end_str:
+        return None
+    return start, min(end, file_size - 1)
+
+
+def is_not_modified(
+    validators: Dict[str, str],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """Whether a conditional GET can be answered with 304 Not Modified"""
+    if if_none_match:
+        # If-None-Match takes precedence; weak comparison per RFC 9110
+        etag = validators["ETag"].removeprefix("W/")
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if if_modified_since:
+        modified = parsedate_to_datetime(validators["Last-Modified"])
+        try:
+            return modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+async def iter_file_range(path: Path, start: int, length: int):
+    """Yield length bytes of a file starting at offset start"""
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(FILE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
 
 @app.get("/files/{date}/{folder}/{filename}")
-async def download_file(date: str, folder: str, filename: str):
+async def download_file(
+    date: str,
+    folder: str,
+    filename: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+):
     """
     Download a file from the download directory
 
+    Supports single byte-range requests so interrupted downloads can resume,
+    and conditional requests so unchanged files are not sent again.
+
     - **date**: Date folder (YYYY-MM-DD format)
     - **folder**: Video folder name
     - **filename**: File name to download
     """
-    file_path = os.path.join("./download", date, folder, filename)
+    file_path = (DOWNLOAD_ROOT / date / folder / filename).resolve()
+
+    # Security check: ensure the path is within download directory
+    if not file_path.is_relative_to(DOWNLOAD_ROOT):
+        raise HTTPException(status_code=403, detail="Access denied")
 
-    if not os.path.exists(file_path):
+    if not file_path.is_file():
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Security check: ensure the path is within download directory
-    abs_file_path = os.path.abspath(file_path)
-    abs_download_dir = os.path.abspath("./download")
+    stat = file_path.stat()
+    file_size = stat.st_size
+    validators = {
+        "ETag": f'"{stat.st_ino:x}-{file_size:x}-{int(stat.st_mtime):x}"',
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        # A video can be re-downloaded into the same path, so clients
+        # revalidate with the ETag instead of caching blindly
+        "Cache-Control": "no-cache",
+    }
 
-    if not abs_file_path.startswith(abs_download_dir):
-        raise HTTPException(status_code=403, detail="Access denied")
+    if is_not_modified(validators, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=validators)
 
-    return FileResponse(
-        path=file_path, filename=filename, media_type="application/octet-stream"
+    byte_range = None
+    if range_header and (not if_range or if_range == validators["ETag"]):
+        byte_range = parse_byte_range(range_header, file_size)
+
+    if byte_range is None:
+        return FileResponse(
+            path=file_path,
+            filename=filename,
+            media_type="application/octet-stream",
+            headers={"Accept-Ranges": "bytes", **validators},
+        )
+
+    start, end = byte_range
+    if start >= file_size:
+        return Response(
+            status_code=416, headers={"Content-Range": f"bytes */{file_size}"}
+        )
+
+    quoted = quote(filename)
+    if quoted != filename:
+        disposition = f"attachment; filename*=utf-8''{quoted}"
+    else:
+        disposition = f'attachment; filename="{filename}"'
+
+    return StreamingResponse(
+        iter_file_range(file_path, start, end - start + 1),
+        status_code=206,
+        media_type="application/octet-stream",
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{file_size}",
+            "Content-Length": str(end - start + 1),
+            "Content-Disposition": disposition,
+            **validators,
+        },
     )
 
 
 @app.delete("/task/{task_id}")
 async def delete_task(task_id: str):
     """
-    Delete a task result from memory
+    Delete a task result
 
     - **task_id**: The task ID to delete
     """
-    if task_id not in task_results:
+    if not await task_store.delete(task_id):
         raise HTTPException(status_code=404, detail="Task not found")
 
-    del task_results[task_id]
-
     return {"success": True, "message": f"Task {task_id} deleted"}
 
 
@@ -510,22 +955,10 @@ async def list_tasks(
     limit: int = Query(10, ge=1, le=100),
 ):
     """List all tasks with optional filtering"""
-    tasks = list(task_results.items())
-
-    # Filter by status if provided
-    if status:
-        tasks = [(tid, task) for tid, task in tasks if task.get("status") == status]
-
-    # Sort by created_at or started_at
-    tasks.sort(
-        key=lambda x: x[1].get("created_at", x[1].get("started_at", "")), reverse=True
-    )
-
-    # Apply limit
-    tasks = tasks[:limit]
+    total, tasks = await task_store.list(status=status, limit=limit)
 
     return {
-        "total": len(task_results),
+        "total": total,
         "filtered": len(tasks),
         "tasks": [
             {
@@ -549,14 +982,49 @@ def start_worker():
 
 
 if __name__ == "__main__":
+    import sys
     import threading
 
     import uvicorn
 
-    worker_thread = threading.Thread(target=start_worker, daemon=True)
-    worker_thread.start()
+    # `python -m src.api worker` runs only the Hatchet worker
+    if sys.argv[1:] == ["worker"]:
+        start_worker()
+        sys.exit(0)
+
+    workers = int(os.getenv("API_WORKERS", 1))
+
+    # In-memory task state is per process, so other processes (and the
+    # separate Hatchet worker) would never see a task
+    if workers > 1 and task_store.backend == "memory":
+        logger.error(
+            f"API_WORKERS={workers} needs REDIS_URL for shared task status. "
+            "Starting a single API process instead."
+        )
+        workers = 1
+
+    # Every API process would register its own Hatchet worker, so with several
+    # processes the worker has to be started separately
+    if workers == 1:
+        worker_thread = threading.Thread(target=start_worker, daemon=True)
+        worker_thread.start()
+    else:
+        logger.info(
+            "API_WORKERS > 1: run the Hatchet worker with `python -m src.api worker`"
+        )
 
     logger.info("Starting Social Video Downloader API with Hatchet...")
 
     port = int(os.getenv("API_PORT", 8001))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    # Several processes need an import string. A single process serves this
+    # module's app, so the in-process worker and the endpoints share state
+    # instead of uvicorn importing a second copy of src.api.
+    uvicorn.run(
+        app if workers == 1 else "src.api:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+    )
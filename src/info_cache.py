@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class InfoCache:
+    """Recently extracted video info, keyed by URL
+
+    Entries live in a bounded in-process LRU by default, or in Redis under
+    ``info:{sha1(url)}`` when a Redis client is given (the TaskStore's) so
+    every API process and Hatchet worker shares them. Entries expire after
+    ``ttl`` seconds; a ttl of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        max_entries: int = 10000,
+        ttl: int = 3600,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # url -> (expiry on the monotonic clock, info)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.redis = redis
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached info for a URL, or None if missing or expired"""
+        if self.ttl <= 0:
+            return None
+
+        if self.redis:
+            value = await asyncio.to_thread(self.redis.get, self._key(url))
+            return json.loads(value) if value else None
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            expires_at, info = entry
+            if expires_at <= time.monotonic():
+                del self._entries[url]
+                return None
+            self._entries.move_to_end(url)
+            return info
+
+    async def set(self, url: str, info: Dict[str, Any]):
+        """Cache info for a URL for ttl seconds"""
+        if self.ttl <= 0:
+            return
+
+        if self.redis:
+            value = json.dumps(info, default=str)
+            await asyncio.to_thread(self.redis.set, self._key(url), value, ex=self.ttl)
+            return
+
+        with self._lock:
+            self._entries[url] = (time.monotonic() + self.ttl, info)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return f"info:{hashlib.sha1(url.encode()).hexdigest()}"
@@ -1,11 +1,83 @@
 import os
+import re
+import shutil
+import socket
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
 import yt_dlp
 from loguru import logger
+from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+
+# Initial read/write block for yt-dlp's HTTP downloader. yt-dlp starts at 1 KiB
+# and grows the block adaptively; starting at 1 MiB skips the ramp-up writes.
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Transfer options shared by every download pass. HLS/DASH fragments are
+# fetched in parallel instead of one at a time over a single connection.
+DOWNLOAD_NETWORK_OPTS = {
+    "buffersize": DOWNLOAD_BUFFER_SIZE,
+    "concurrent_fragment_downloads": int(os.getenv("YT_CONCURRENT_FRAGMENTS", 8)),
+    "http_chunk_size": 10 * 1024 * 1024,
+    "retries": 3,
+    "fragment_retries": 3,
+    "socket_timeout": 30,
+}
+
+# Videos of one playlist or channel downloaded at the same time
+PLAYLIST_CONCURRENCY = int(os.getenv("DL_CONCURRENCY", 4))
+
+# Videos downloaded at the same time in this process, across all batches,
+# playlists and workflow runs, however their own concurrency settings multiply
+MAX_ACTIVE_DOWNLOADS = int(os.getenv("MAX_ACTIVE_DOWNLOADS", 8))
+_download_slots = threading.BoundedSemaphore(MAX_ACTIVE_DOWNLOADS)
+
+# Host -> platform in one match: the host must be the platform domain or one
+# of its subdomains (vt.tiktok.com), and the group name is the platform
+_PLATFORM_RE = re.compile(
+    r"(?:^|\.)(?:"
+    r"(?P<tiktok>tiktok\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<facebook>facebook\.com|fb\.com)"
+    r"|(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<twitter>twitter\.com|x\.com)"
+    r")$"
+)
+
+# YouTube playlists/channels, and TikTok profiles that are not a single video
+_PLAYLIST_RE = re.compile(
+    r"youtube\.com.*?(?:/playlist\?|/channel/|/@|/c/)|tiktok\.com/@(?!.*/video/)"
+)
+
+
+# Characters dropped from titles to build folder names: anything other than
+# letters, digits (str.isalnum), underscore, space and hyphen
+_UNSAFE_TITLE_RE = re.compile(r"[^\w \-]")
+
+# Hosts resolved in the background at startup so the first download from each
+# platform does not wait on a DNS lookup
+PLATFORM_HOSTS = (
+    "www.tiktok.com",
+    "www.youtube.com",
+    "www.instagram.com",
+    "www.facebook.com",
+    "twitter.com",
+    "x.com",
+)
+
+
+def prefetch_dns(hosts=PLATFORM_HOSTS):
+    """Resolve hosts to warm the resolver cache, ignoring failures"""
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.debug(f"DNS prefetch failed for {host}: {e}")
 
 
 class SocialVideoDownloader:
@@ -13,35 +85,101 @@ class SocialVideoDownloader:
         self.download_dir = download_dir
         self.current_date = datetime.now().strftime("%Y-%m-%d")
         self.download_dir = os.path.join(download_dir, self.current_date)
+        # YoutubeDL is not thread-safe, so each thread gets its own instance
+        self._local = threading.local()
+        # Located once and passed to yt-dlp so it does not search PATH itself
+        self.ffmpeg_location = shutil.which("ffmpeg")
         self.setup_directories()
+        threading.Thread(target=prefetch_dns, daemon=True).start()
 
     def setup_directories(self):
         os.makedirs(self.download_dir, exist_ok=True)
 
-    def identify_platform(self, url):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def identify_platform(url):
         """Identify the platform from URL"""
-        domain = urlparse(url).netloc.lower()
-        if "tiktok.com" in domain:
-            return "tiktok"
-        elif "instagram.com" in domain:
-            return "instagram"
-        elif "facebook.com" in domain or "fb.com" in domain:
-            return "facebook"
-        elif "youtube.com" in domain or "youtu.be" in domain:
-            return "youtube"
-        elif "twitter.com" in domain or "x.com" in domain:
-            return "twitter"
+        match = _PLATFORM_RE.search(urlparse(url).hostname or "")
+        return match.lastgroup if match else "unknown"
+
+    def _info_ydl(self) -> yt_dlp.YoutubeDL:
+        """Metadata-only YoutubeDL reused across calls on the current thread
+
+        Keeping the instance keeps its HTTP handlers, cookies and initialized
+        extractors, so repeated lookups skip that setup and can reuse open
+        connections.
+        """
+        ydl = getattr(self._local, "info_ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(
+                {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "ffmpeg_location": self.ffmpeg_location,
+                }
+            )
+            self._local.info_ydl = ydl
+        return ydl
+
+    def _download_ydl(
+        self, video: bool, audio: bool, subtitles: bool
+    ) -> yt_dlp.YoutubeDL:
+        """Downloading YoutubeDL for these options, reused on the current thread
+
+        Postprocessors are fixed when a YoutubeDL is created, so there is one
+        instance per combination of options. The output folder is set per
+        download through the "paths" param.
+        """
+        key = (video, audio, subtitles)
+        instances = getattr(self._local, "download_ydls", None)
+        if instances is None:
+            instances = self._local.download_ydls = {}
+        ydl = instances.get(key)
+        if ydl is not None:
+            return ydl
+
+        ydl_opts = {
+            "outtmpl": "video.%(ext)s",
+            **DOWNLOAD_NETWORK_OPTS,
+            "quiet": True,
+            "no_warnings": True,
+            "ffmpeg_location": self.ffmpeg_location,
+        }
+        if subtitles:
+            ydl_opts.update(
+                {
+                    "allsubtitles": True,
+                    "writesubtitles": True,
+                    "writeautomaticsub": True,
+                    "subtitlesformat": "vtt",
+                    "subtitleslangs": ["all"],
+                }
+            )
+        if video:
+            ydl_opts["format"] = (
+                "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
+            )
+            ydl_opts["postprocessors"] = [
+                {"key": "FFmpegVideoConvertor", "preferedformat": "mp4"}
+            ]
+        elif audio:
+            ydl_opts["format"] = "bestaudio/best"
+            ydl_opts["postprocessors"] = [
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": "wav",
+                    "preferredquality": "192",
+                }
+            ]
         else:
-            return "unknown"
+            ydl_opts["skip_download"] = True
+
+        ydl = instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+        return ydl
 
     def is_playlist_or_channel(self, url):
         """Check if URL is a playlist or channel"""
-        if "youtube.com" in url:
-            if "/playlist?" in url or "/channel/" in url or "/@" in url or "/c/" in url:
-                return True
-        elif "tiktok.com/@" in url and "/video/" not in url:
-            return True
-        return False
+        return _PLAYLIST_RE.search(url) is not None
 
     def download_single_video(
         self, url: str, video: bool = True, audio: bool = True, subtitles: bool = True
@@ -57,7 +195,13 @@ class SocialVideoDownloader:
         Returns:
             Dict with download results and paths
         """
+        # Waits for a free slot so at most MAX_ACTIVE_DOWNLOADS run at once
+        with _download_slots:
+            return self._download_single_video(url, video, audio, subtitles)
 
+    def _download_single_video(
+        self, url: str, video: bool, audio: bool, subtitles: bool
+    ) -> Dict:
         platform = self.identify_platform(url)
         timestamp = str(int(time.time()))
 
@@ -72,126 +216,74 @@ class SocialVideoDownloader:
 
         try:
             # Get video info first
-            with yt_dlp.YoutubeDL({"quiet": False}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                video_title = info.get("title", "unknown")
-                safe_title = "".join(
-                    c for c in video_title if c.isalnum() or c in (" ", "-", "_")
-                ).rstrip()
-                safe_title = safe_title[:100]  # Limit folder name length
-
-                video_folder = os.path.join(self.download_dir, safe_title)
-                os.makedirs(video_folder, exist_ok=True)
-
-            # Download video
-            if video:
-                video_path = os.path.join(video_folder, "video.%(ext)s")
-                ydl_opts = {
-                    "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
-                    "outtmpl": video_path,
-                    "quiet": True,
-                    "no_warnings": True,
-                    "allsubtitles": subtitles,
-                    "writesubtitles": subtitles,
-                    "writeautomaticsub": subtitles,
-                    "subtitlesformat": "vtt",
-                    "subtitleslangs": ["all"],
-                    "postprocessors": [
-                        {"key": "FFmpegVideoConvertor", "preferedformat": "mp4"}
-                    ],
-                }
-
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                    actual_video_path = video_path.replace("%(ext)s", "mp4")
-                    if os.path.exists(actual_video_path):
-                        result["paths"]["video"] = actual_video_path
-                        logger.success(f"Video downloaded: {actual_video_path}")
-
-                    # Check for subtitle files downloaded with video
-                    if subtitles:
-                        for lang_code in ["vie-VN", "eng-US"]:
-                            subtitle_file = os.path.join(
-                                video_folder, f"video.{lang_code}.vtt"
-                            )
-                            if os.path.exists(subtitle_file):
-                                new_subtitle_file = os.path.join(
-                                    video_folder, f"sub-{lang_code}.vtt"
-                                )
-                                os.rename(subtitle_file, new_subtitle_file)
-                                result["paths"]["subtitles"][lang_code] = (
-                                    new_subtitle_file
-                                )
-                                logger.success(
-                                    f"Subtitle downloaded: {new_subtitle_file}"
-                                )
-
-            # Download audio
-            if audio:
-                audio_path = os.path.join(video_folder, "audio.%(ext)s")
-                ydl_opts = {
-                    "format": "bestaudio/best",
-                    "outtmpl": audio_path,
-                    "quiet": True,
-                    "no_warnings": True,
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio",
-                            "preferredcodec": "wav",
-                            "preferredquality": "192",
-                        }
-                    ],
-                }
-
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                    actual_audio_path = os.path.join(video_folder, "audio.wav")
-                    if os.path.exists(actual_audio_path):
-                        result["paths"]["audio"] = actual_audio_path
-                        logger.success(f"Audio downloaded: {actual_audio_path}")
-
-            # Download subtitles separately if not already downloaded with video
-            if subtitles and not result["paths"]["subtitles"]:
-                subtitle_path = os.path.join(video_folder, "sub.%(ext)s")
-                ydl_opts = {
-                    "skip_download": True,
-                    "allsubtitles": True,
-                    "writesubtitles": True,
-                    "writeautomaticsub": True,
-                    "subtitlesformat": "vtt",
-                    "subtitleslangs": ["all"],
-                    "outtmpl": subtitle_path,
-                    "quiet": True,
-                    "no_warnings": True,
-                }
-
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                    for lang_code in ["vie-VN", "eng-US"]:
-                        subtitle_file = os.path.join(
-                            video_folder, f"sub.{lang_code}.vtt"
+            info = self._info_ydl().extract_info(url, download=False)
+            video_title = info.get("title", "unknown")
+            safe_title = _UNSAFE_TITLE_RE.sub("", video_title).rstrip()
+            safe_title = safe_title[:100]  # Limit folder name length
+
+            video_folder = self._make_video_folder(safe_title, timestamp)
+
+            # One pass downloads everything requested from the info extracted
+            # above instead of extracting the page again; the audio track is
+            # taken from the downloaded video instead of being fetched again.
+            # Like download_with_info_file, the formats the metadata pass
+            # selected are dropped so this pass selects its own.
+            ydl = self._download_ydl(video, audio, subtitles)
+            ydl.params["paths"] = {"home": video_folder}
+            ydl.process_ie_result(
+                yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True),
+                download=True,
+            )
+
+            # List the folder once instead of stat-ing each expected file, and
+            # rename relative to its descriptor instead of re-walking the path
+            dir_fd = os.open(video_folder, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                present = {entry.name for entry in os.scandir(dir_fd)}
+
+                actual_video_path = os.path.join(video_folder, "video.mp4")
+                actual_audio_path = os.path.join(video_folder, "audio.wav")
+                if video and "video.mp4" in present:
+                    result["paths"]["video"] = actual_video_path
+                    logger.success(f"Video downloaded: {actual_video_path}")
+
+                    if audio:
+                        FFmpegPostProcessor(ydl).run_ffmpeg(
+                            actual_video_path,
+                            actual_audio_path,
+                            ["-vn", "-acodec", "pcm_s16le"],
                         )
-                        if os.path.exists(subtitle_file):
-                            new_subtitle_file = os.path.join(
-                                video_folder, f"sub-{lang_code}.vtt"
-                            )
-                            os.rename(subtitle_file, new_subtitle_file)
-                            result["paths"]["subtitles"][lang_code] = new_subtitle_file
-                            logger.success(f"Subtitle downloaded: {new_subtitle_file}")
-
-                if (
-                    not video
-                    and "actual_video_path" in locals()
-                    and os.path.exists(actual_video_path)
-                ):
-                    os.remove(actual_video_path)
-
-                if (
-                    not audio
-                    and "actual_audio_path" in locals()
-                    and os.path.exists(actual_audio_path)
-                ):
-                    os.remove(actual_audio_path)
+                        present.add("audio.wav")
+                elif audio and "video.wav" in present:
+                    # Audio-only downloads are extracted to video.wav
+                    os.rename(
+                        "video.wav", "audio.wav", src_dir_fd=dir_fd, dst_dir_fd=dir_fd
+                    )
+                    present.add("audio.wav")
+
+                if audio and "audio.wav" in present:
+                    result["paths"]["audio"] = actual_audio_path
+                    logger.success(f"Audio downloaded: {actual_audio_path}")
+
+                if subtitles:
+                    # Every language written with the video is video.<lang>.vtt
+                    for name in sorted(present):
+                        if not (name.startswith("video.") and name.endswith(".vtt")):
+                            continue
+                        lang_code = name[len("video.") : -len(".vtt")]
+                        new_subtitle_file = os.path.join(
+                            video_folder, f"sub-{lang_code}.vtt"
+                        )
+                        os.rename(
+                            name,
+                            f"sub-{lang_code}.vtt",
+                            src_dir_fd=dir_fd,
+                            dst_dir_fd=dir_fd,
+                        )
+                        result["paths"]["subtitles"][lang_code] = new_subtitle_file
+                        logger.success(f"Subtitle downloaded: {new_subtitle_file}")
+            finally:
+                os.close(dir_fd)
 
             result["success"] = True
 
@@ -201,14 +293,44 @@ class SocialVideoDownloader:
 
         return result
 
+    def _make_video_folder(self, title: str, timestamp: str) -> str:
+        """Create a new folder for a video, suffixing the title if it is taken
+
+        os.mkdir fails if the folder already exists, which is atomic across
+        the API and worker processes sharing download_dir, so videos with the
+        same title (e.g. "unknown") never overwrite each other.
+
+        Returns:
+            Path of the created folder
+        """
+        # The dated folder may have been removed while the process runs
+        os.makedirs(self.download_dir, exist_ok=True)
+
+        name = title
+        n = 0
+        while True:
+            path = os.path.join(self.download_dir, name)
+            try:
+                os.mkdir(path)
+                return path
+            except FileExistsError:
+                n += 1
+                name = (
+                    f"{title}-{timestamp}" if n == 1 else f"{title}-{timestamp}-{n - 1}"
+                )
+
     def download_playlist_or_channel(
-        self, url: str, download_options: Optional[Dict] = None
+        self,
+        url: str,
+        download_options: Optional[Dict] = None,
+        max_workers: int = PLAYLIST_CONCURRENCY,
     ) -> Dict:
         """Download all videos from a playlist or channel
 
         Args:
             url: Playlist or channel URL
             download_options: Dict with keys 'video', 'audio', 'subtitles'
+            max_workers: Number of videos downloaded concurrently
 
         Returns:
             Dict with download results for all videos
@@ -234,35 +356,71 @@ class SocialVideoDownloader:
             }
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                playlist_info = ydl.extract_info(url, download=False)
+                # process=False leaves entries as yt-dlp's lazy iterator, so
+                # downloads start while later pages are still being listed
+                playlist_info = ydl.extract_info(url, download=False, process=False)
+                # Follow redirects, e.g. a channel URL to its videos tab
+                while playlist_info.get("_type") in ("url", "url_transparent"):
+                    playlist_info = ydl.extract_info(
+                        playlist_info["url"],
+                        download=False,
+                        process=False,
+                        ie_key=playlist_info.get("ie_key"),
+                    )
 
                 if "entries" in playlist_info:
-                    entries = list(playlist_info["entries"])
-                    result["total_videos"] = len(entries)
-                    logger.info(f"Found {len(entries)} videos in {result['type']}")
-
-                    for i, entry in enumerate(entries, 1):
-                        if entry:
-                            video_url = (
-                                entry.get("url")
-                                or f"https://www.youtube.com/watch?v={entry.get('id')}"
-                            )
-                            logger.info(
-                                f"[{i}/{len(entries)}] Processing: {entry.get('title', 'Unknown')}"
-                            )
-
-                            video_result = self.download_single_video(
-                                video_url,
-                                video=download_options.get("video", True),
-                                audio=download_options.get("audio", True),
-                                subtitles=download_options.get("subtitles", True),
-                            )
-                            result["videos"].append(video_result)
-
-                            if video_result["success"]:
-                                result["successful_downloads"] += 1
-                            else:
-                                result["failed_downloads"] += 1
+                    logger.info(f"Downloading {result['type']} entries as listed")
+
+                    def download_entry(i: int, entry: Dict) -> Dict:
+                        video_url = (
+                            entry.get("url")
+                            or f"https://www.youtube.com/watch?v={entry.get('id')}"
+                        )
+                        logger.info(
+                            f"[{i}] Processing: {entry.get('title', 'Unknown')}"
+                        )
+                        return self.download_single_video(
+                            video_url,
+                            video=download_options.get("video", True),
+                            audio=download_options.get("audio", True),
+                            subtitles=download_options.get("subtitles", True),
+                        )
+
+                    futures = []
+                    in_flight = set()
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        try:
+                            for i, entry in enumerate(playlist_info["entries"], 1):
+                                result["total_videos"] = i
+                                if not entry:
+                                    continue
+                                # Submit only when a worker is free, so listing
+                                # never runs far ahead of the downloads
+                                if len(in_flight) >= max_workers:
+                                    _, in_flight = wait(
+                                        in_flight, return_when=FIRST_COMPLETED
+                                    )
+                                future = executor.submit(download_entry, i, entry)
+                                futures.append(future)
+                                in_flight.add(future)
+                        except Exception as e:
+                            # A later page failed to list; the videos already
+                            # submitted are still downloaded and reported
+                            result["error"] = str(e)
+                            logger.error(f"Error listing {result['type']}: {e}")
+
+                    logger.info(
+                        f"Found {result['total_videos']} videos in {result['type']}"
+                    )
+
+                    for future in futures:
+                        video_result = future.result()
+                        result["videos"].append(video_result)
+
+                        if video_result["success"]:
+                            result["successful_downloads"] += 1
+                        else:
+                            result["failed_downloads"] += 1
                 else:
                     # Single video, not a playlist
                     video_result = self.download_single_video(
@@ -285,13 +443,19 @@ class SocialVideoDownloader:
         return result
 
     def download_from_urls(
-        self, urls: Union[str, List[str]], download_options: Optional[Dict] = None
+        self,
+        urls: Union[str, List[str]],
+        download_options: Optional[Dict] = None,
+        max_workers: int = 1,
+        on_result: Optional[Callable[[int, Dict], None]] = None,
     ) -> Dict:
         """Download from single URL, list of URLs, playlist, or channel
 
         Args:
             urls: Single URL string or list of URLs
             download_options: Dict with keys 'video', 'audio', 'subtitles'
+            max_workers: Number of URLs processed concurrently (default 1, sequential)
+            on_result: Called with the URL index and its result as each URL finishes
 
         Returns:
             Dict with all download results and paths
@@ -299,6 +463,9 @@ class SocialVideoDownloader:
         if isinstance(urls, str):
             urls = [urls]
 
+        if download_options is None:
+            download_options = {"video": True, "audio": True, "subtitles": True}
+
         results = {
             "date": self.current_date,
             "download_directory": self.download_dir,
@@ -309,33 +476,30 @@ class SocialVideoDownloader:
             "downloads": [],
         }
 
-        for url in urls:
-            logger.info(f"{'=' * 60}")
-            logger.info(f"Processing: {url}")
-            logger.info("=" * 60)
-
-            if self.is_playlist_or_channel(url):
-                # Handle playlist or channel
-                playlist_result = self.download_playlist_or_channel(
-                    url, download_options
-                )
-                results["downloads"].append(playlist_result)
-                results["total_videos"] += playlist_result["total_videos"]
-                results["successful_downloads"] += playlist_result[
-                    "successful_downloads"
-                ]
-                results["failed_downloads"] += playlist_result["failed_downloads"]
+        def download(i: int, url: str) -> Dict:
+            url_result = self._download_url(url, download_options)
+            if on_result is not None:
+                on_result(i, url_result)
+            return url_result
+
+        max_workers = min(max_workers, len(urls))
+        if max_workers > 1:
+            # Downloads are network/ffmpeg bound, so threads overlap the waits
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                url_results = list(executor.map(download, range(len(urls)), urls))
+        else:
+            url_results = [download(i, url) for i, url in enumerate(urls)]
+
+        for url_result in url_results:
+            results["downloads"].append(url_result)
+            if "total_videos" in url_result:
+                # Playlist or channel
+                results["total_videos"] += url_result["total_videos"]
+                results["successful_downloads"] += url_result["successful_downloads"]
+                results["failed_downloads"] += url_result["failed_downloads"]
             else:
-                # Handle single video
-                video_result = self.download_single_video(
-                    url,
-                    video=download_options.get("video", True),
-                    audio=download_options.get("audio", True),
-                    subtitles=download_options.get("subtitles", True),
-                )
-                results["downloads"].append(video_result)
                 results["total_videos"] += 1
-                if video_result["success"]:
+                if url_result["success"]:
                     results["successful_downloads"] += 1
                 else:
                     results["failed_downloads"] += 1
@@ -354,6 +518,22 @@ class SocialVideoDownloader:
 
         return results
 
+    def _download_url(self, url: str, download_options: Dict) -> Dict:
+        """Download a single video, playlist or channel URL"""
+        logger.info(f"{'=' * 60}")
+        logger.info(f"Processing: {url}")
+        logger.info("=" * 60)
+
+        if self.is_playlist_or_channel(url):
+            return self.download_playlist_or_channel(url, download_options)
+
+        return self.download_single_video(
+            url,
+            video=download_options.get("video", True),
+            audio=download_options.get("audio", True),
+            subtitles=download_options.get("subtitles", True),
+        )
+
     def get_video_info(self, url: str) -> Optional[Dict]:
         """Get video information without downloading
 
@@ -364,35 +544,48 @@ class SocialVideoDownloader:
             Dict with video metadata
         """
         try:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
+            info = self._info_ydl().extract_info(url, download=False)
+
+            return {
+                "title": info.get("title", "N/A"),
+                "duration": info.get("duration", "N/A"),
+                "uploader": info.get("uploader", "N/A"),
+                "view_count": info.get("view_count", "N/A"),
+                "description": info.get("description", "N/A"),
+                "upload_date": info.get("upload_date", "N/A"),
+                "webpage_url": info.get("webpage_url", url),
+                "thumbnail": info.get("thumbnail", None),
+                "subtitles": list(info.get("subtitles", {}).keys()),
+                "automatic_captions": list(info.get("automatic_captions", {}).keys()),
             }
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                return {
-                    "title": info.get("title", "N/A"),
-                    "duration": info.get("duration", "N/A"),
-                    "uploader": info.get("uploader", "N/A"),
-                    "view_count": info.get("view_count", "N/A"),
-                    "description": info.get("description", "N/A"),
-                    "upload_date": info.get("upload_date", "N/A"),
-                    "webpage_url": info.get("webpage_url", url),
-                    "thumbnail": info.get("thumbnail", None),
-                    "subtitles": list(info.get("subtitles", {}).keys()),
-                    "automatic_captions": list(
-                        info.get("automatic_captions", {}).keys()
-                    ),
-                }
-
         except Exception as e:
             logger.error(f"Error extracting video info: {e}")
             return None
 
 
 if __name__ == "__main__":
+    import argparse
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description="Download social media videos")
+    parser.add_argument("urls", nargs="*", help="Video, playlist or channel URLs")
+    parser.add_argument("--batch", help="File of URLs, one per line")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of URLs to download in parallel (default: 1)",
+    )
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.batch:
+        # URLs never contain whitespace, so split() strips and drops blanks in one pass
+        urls.extend(Path(args.batch).read_text().split())
+    if not urls:
+        parser.error("no URLs given (pass URLs or --batch FILE)")
+
     downloader = SocialVideoDownloader()
-    results = downloader.download_from_urls(["https://vt.tiktok.com/ZSAo286Hf"])
+    results = downloader.download_from_urls(urls, max_workers=args.concurrency)
     print(results)
@@ -0,0 +1,266 @@
+import asyncio
+import heapq
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+TASK_STATUSES = ("pending", "processing", "completed", "failed")
+
+# Sorted set of task ids scored by creation time, for listing and counting
+CREATED_KEY = "tasks:created"
+
+
+def _task_time(item: Tuple[str, Dict[str, Any]]) -> str:
+    task = item[1]
+    return task.get("created_at") or task.get("started_at") or ""
+
+
+class TaskStore:
+    """Status records for API tasks
+
+    Records are kept in a bounded in-process LRU by default. When a Redis URL
+    is given they are kept in Redis instead, so every API process and Hatchet
+    worker sees the same state. Each task is stored as a hash of JSON-encoded
+    fields that expires after ``ttl`` seconds. A sorted set by creation time
+    orders listings and one set per status indexes filtered listings.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_entries: int = 10000,
+        ttl: int = 86400,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Serialized records served by get_json, dropped when a task changes
+        self._json: Dict[str, bytes] = {}
+        # Steps run on the Hatchet worker thread, requests on the API loop
+        self._lock = threading.Lock()
+        self.redis = None
+
+        if redis_url and REDIS_AVAILABLE:
+            self.redis = redis.Redis.from_url(redis_url)
+        elif redis_url:
+            logger.warning("redis package not installed. Keeping tasks in memory.")
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self.redis else "memory"
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task record, or None if it does not exist"""
+        if self.redis:
+            return await asyncio.to_thread(self._redis_get, task_id)
+
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            self._tasks.move_to_end(task_id)
+            return dict(task)
+
+    async def get_json(self, task_id: str) -> Optional[bytes]:
+        """Get a task record as JSON bytes, or None if it does not exist
+
+        Polling clients read the same record many times between updates, so
+        the serialized form is cached until the task changes. On Redis the
+        stored fields are already JSON and are joined without decoding.
+        """
+        if self.redis:
+            return await asyncio.to_thread(self._redis_get_json, task_id)
+
+        with self._lock:
+            body = self._json.get(task_id)
+            if body is not None:
+                self._tasks.move_to_end(task_id)
+                return body
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            self._tasks.move_to_end(task_id)
+            body = json.dumps(task, default=str).encode()
+            self._json[task_id] = body
+            return body
+
+    async def set(self, task_id: str, task: Dict[str, Any]):
+        """Create or replace a task record"""
+        if self.redis:
+            await asyncio.to_thread(self._redis_set, task_id, task)
+            return
+
+        with self._lock:
+            self._tasks[task_id] = dict(task)
+            self._json.pop(task_id, None)
+            self._tasks.move_to_end(task_id)
+            self._evict()
+
+    async def update(self, task_id: str, fields: Dict[str, Any]):
+        """Merge fields into a task record, creating it if needed
+
+        Only the given fields are written, so concurrent writers updating
+        different fields of the same task do not overwrite each other.
+        """
+        if self.redis:
+            await asyncio.to_thread(self._redis_update, task_id, fields)
+            return
+
+        with self._lock:
+            self._tasks.setdefault(task_id, {}).update(fields)
+            self._json.pop(task_id, None)
+            self._tasks.move_to_end(task_id)
+            self._evict()
+
+    async def delete(self, task_id: str) -> bool:
+        """Delete a task record, returning whether it existed"""
+        if self.redis:
+            return await asyncio.to_thread(self._redis_delete, task_id)
+
+        with self._lock:
+            self._json.pop(task_id, None)
+            return self._tasks.pop(task_id, None) is not None
+
+    async def list(
+        self, status: Optional[str] = None, limit: int = 10
+    ) -> Tuple[int, List[Tuple[str, Dict[str, Any]]]]:
+        """List the most recent tasks, optionally filtered by status
+
+        Returns:
+            Tuple of (total number of tasks, [(task_id, task), ...])
+        """
+        if self.redis:
+            return await asyncio.to_thread(self._redis_list, status, limit)
+
+        with self._lock:
+            total = len(self._tasks)
+            items = self._tasks.items()
+            if status:
+                items = (
+                    (tid, task) for tid, task in items if task.get("status") == status
+                )
+            # Newest by created_at or started_at without sorting every task
+            newest = heapq.nlargest(limit, items, key=_task_time)
+            return total, [(tid, dict(task)) for tid, task in newest]
+
+    def _evict(self):
+        """Drop least recently used records over max_entries (lock held)"""
+        while len(self._tasks) > self.max_entries:
+            task_id, _ = self._tasks.popitem(last=False)
+            self._json.pop(task_id, None)
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"task:{task_id}"
+
+    @staticmethod
+    def _status_key(status: str) -> str:
+        return f"tasks:status:{status}"
+
+    @staticmethod
+    def _decode(fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+        return {k.decode(): json.loads(v) for k, v in fields.items()}
+
+    def _redis_get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        fields = self.redis.hgetall(self._key(task_id))
+        return self._decode(fields) if fields else None
+
+    def _redis_get_json(self, task_id: str) -> Optional[bytes]:
+        fields = self.redis.hgetall(self._key(task_id))
+        if not fields:
+            return None
+        items = (json.dumps(k.decode()).encode() + b":" + v for k, v in fields.items())
+        return b"{" + b",".join(items) + b"}"
+
+    def _redis_set(self, task_id: str, task: Dict[str, Any]):
+        pipe = self.redis.pipeline()
+        pipe.delete(self._key(task_id))
+        self._redis_write(pipe, task_id, task)
+        pipe.execute()
+
+    def _redis_update(self, task_id: str, fields: Dict[str, Any]):
+        pipe = self.redis.pipeline()
+        self._redis_write(pipe, task_id, fields)
+        pipe.execute()
+
+    def _redis_write(self, pipe, task_id: str, fields: Dict[str, Any]):
+        """Queue an HSET of fields plus expiry and status index upkeep"""
+        key = self._key(task_id)
+        pipe.hset(
+            key, mapping={k: json.dumps(v, default=str) for k, v in fields.items()}
+        )
+        pipe.expire(key, self.ttl)
+        status = fields.get("status")
+        if status:
+            for other in TASK_STATUSES:
+                if other != status:
+                    pipe.srem(self._status_key(other), task_id)
+            pipe.sadd(self._status_key(status), task_id)
+        # nx keeps the score from the first write when a task is replaced
+        pipe.zadd(CREATED_KEY, {task_id: time.time()}, nx=True)
+
+    def _redis_delete(self, task_id: str) -> bool:
+        pipe = self.redis.pipeline()
+        pipe.delete(self._key(task_id))
+        pipe.zrem(CREATED_KEY, task_id)
+        for status in TASK_STATUSES:
+            pipe.srem(self._status_key(status), task_id)
+        return bool(pipe.execute()[0])
+
+    def _redis_list(
+        self, status: Optional[str], limit: int
+    ) -> Tuple[int, List[Tuple[str, Dict[str, Any]]]]:
+        # Records expire on their own; drop index entries past the TTL
+        self.redis.zremrangebyscore(CREATED_KEY, "-inf", time.time() - self.ttl)
+        total = self.redis.zcard(CREATED_KEY)
+
+        if status:
+            members = [
+                m.decode() for m in self.redis.smembers(self._status_key(status))
+            ]
+            scores = self.redis.zmscore(CREATED_KEY, members) if members else []
+            newest = heapq.nlargest(
+                limit,
+                ((score, tid) for tid, score in zip(members, scores) if score),
+            )
+            task_ids = [tid for _, tid in newest]
+            unindexed = [tid for tid, score in zip(members, scores) if not score]
+            if unindexed:
+                self.redis.srem(self._status_key(status), *unindexed)
+        else:
+            task_ids = [
+                m.decode() for m in self.redis.zrevrange(CREATED_KEY, 0, limit - 1)
+            ]
+
+        pipe = self.redis.pipeline()
+        for task_id in task_ids:
+            pipe.hgetall(self._key(task_id))
+
+        tasks = []
+        expired = []
+        for task_id, fields in zip(task_ids, pipe.execute()):
+            if fields:
+                tasks.append((task_id, self._decode(fields)))
+            else:
+                expired.append(task_id)
+
+        # Index entries outlive their expired records; drop them lazily
+        if expired:
+            pipe = self.redis.pipeline()
+            pipe.zrem(CREATED_KEY, *expired)
+            for other in TASK_STATUSES:
+                pipe.srem(self._status_key(other), *expired)
+            pipe.execute()
+
+        return total, tasks